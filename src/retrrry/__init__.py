@@ -14,45 +14,105 @@
 ## limitations under the License.
 
 import random
-import sys
 import time
-import traceback
+import types
 from functools import wraps
 
 
 MAX_WAIT = 1073741823
+_MS_TO_S = 0.001
 
+try:
+    _monotonic_ns = time.monotonic_ns
+except AttributeError:  # Python < 3.7
 
-def _reraise(tp, value, tb=None):
-    try:
-        if value is None:
-            value = tp()
-        if value.__traceback__ is not tb:
-            raise value.with_traceback(tb)
-        raise value
-    finally:
-        value = None
-        tb = None
+    def _monotonic_ns():
+        return int(time.monotonic() * 1_000_000_000)
+
+
+def _flatten_types(retryable_types):
+    # isinstance accepts nested tuples of types, keep accepting them here
+    for t in retryable_types:
+        if isinstance(t, tuple):
+            yield from _flatten_types(t)
+        else:
+            yield t
 
 
 def _retry_if_exception_of_type(retryable_types):
-    def _retry_if_exception_these_types(exception):
-        return isinstance(exception, retryable_types)
+    retryable_types = tuple(_flatten_types(retryable_types))
+    for t in retryable_types:
+        if not (isinstance(t, type) and issubclass(t, BaseException)):
+            raise TypeError(
+                f"retry_on_exception types must be exception classes, got {t!r}"
+            )
+
+    # exact type matches are a single hash lookup, subclasses fall back to isinstance
+    def _retry_if_exception_these_types(
+        exception, exact=frozenset(retryable_types), retryable_types=retryable_types
+    ):
+        return type(exception) in exact or isinstance(exception, retryable_types)
 
     return _retry_if_exception_these_types
 
 
-def _current_time_ms():
-    return int(round(time.time() * 1000))
+def _noop(attempt_number):
+    return None
+
+
+def _never_stop(previous_attempt_number, delay_since_first_attempt_ms):
+    return False
+
+
+def _no_wait(previous_attempt_number, delay_since_first_attempt_ms):
+    return 0
+
+
+def _any_stop(stop_funcs):
+    if not stop_funcs:
+        return _never_stop
+    if len(stop_funcs) == 1:
+        return stop_funcs[0]
+    first, second = stop_funcs
+    return lambda attempts, delay: first(attempts, delay) or second(attempts, delay)
+
+
+def _max_wait(wait_funcs):
+    if not wait_funcs:
+        return _no_wait
+    if len(wait_funcs) == 1:
+        return wait_funcs[0]
+    wait_funcs = tuple(wait_funcs)
+    return lambda attempts, delay: max([f(attempts, delay) for f in wait_funcs])
 
 
 def retry(_f=None, **dkwds):
-    """Decorator function that instantiates the Retry object."""
+    """
+    Decorator function that instantiates the Retry object.
+
+    The Retry object is built once at decoration time and shared by every call of the decorated
+    function, so mutating its attributes between calls is not supported.
+    """
 
     def decorator(f):
+        if not dkwds:
+            # the default Retry never rejects a result, so only a raised exception needs the
+            # retry machinery, entered outside the handler so the first failure is released
+            @wraps(f)
+            def default_wrapper(*args, **kwds):
+                try:
+                    return f(*args, **kwds)
+                except BaseException:
+                    pass
+                return _default_retry.call(f, *args, **kwds)
+
+            return default_wrapper
+
+        r = Retry(**dkwds)
+
         @wraps(f)
         def wrapper(*args, **kwds):
-            return Retry(**dkwds).call(f, *args, **kwds)
+            return r.call(f, *args, **kwds)
 
         return wrapper
 
@@ -63,6 +123,30 @@ def retry(_f=None, **dkwds):
 
 
 class Retry:
+    __slots__ = (
+        "_stop_max_attempt_number",
+        "_stop_max_delay",
+        "_wait_fixed",
+        "_wait_random_min",
+        "_wait_random_max",
+        "_wait_random_upper",
+        "_wait_incrementing_start",
+        "_wait_incrementing_increment",
+        "_wait_incrementing_max",
+        "_wait_exponential_multiplier",
+        "_wait_exponential_max",
+        "_wait_jitter_max",
+        "_before_attempts",
+        "_after_attempts",
+        "_retry_on_exception",
+        "_retry_on_result",
+        "_wrap_exception",
+        "_fast_path",
+        "_reject",
+        "stop",
+        "wait",
+    )
+
     def __init__(
         self,
         stop=None,
@@ -85,6 +169,7 @@ class Retry:
         wait_jitter_max=None,
         before_attempts=None,
         after_attempts=None,
+        wait_exponential_jitter=False,
     ):
         self._stop_max_attempt_number = (
             5 if stop_max_attempt_number is None else stop_max_attempt_number
@@ -93,6 +178,8 @@ class Retry:
         self._wait_fixed = 1000 if wait_fixed is None else wait_fixed
         self._wait_random_min = 0 if wait_random_min is None else wait_random_min
         self._wait_random_max = 1000 if wait_random_max is None else wait_random_max
+        # randrange excludes its upper bound, randint(min, max) is randrange(min, max + 1)
+        self._wait_random_upper = self._wait_random_max + 1
         self._wait_incrementing_start = (
             0 if wait_incrementing_start is None else wait_incrementing_start
         )
@@ -109,8 +196,9 @@ class Retry:
             MAX_WAIT if wait_incrementing_max is None else wait_incrementing_max
         )
         self._wait_jitter_max = 0 if wait_jitter_max is None else wait_jitter_max
-        self._before_attempts = before_attempts
-        self._after_attempts = after_attempts
+        # callbacks are always invoked, a missing one is replaced by a no-op
+        self._before_attempts = before_attempts or _noop
+        self._after_attempts = after_attempts or _noop
 
         # stop behavior
         stop_funcs = []
@@ -123,14 +211,12 @@ class Retry:
         if stop_func is not None:
             self.stop = stop_func
         elif stop is None:
-            self.stop = lambda attempts, delay: any(
-                f(attempts, delay) for f in stop_funcs
-            )
+            self.stop = _any_stop(stop_funcs)
         else:
-            self.stop = getattr(self, stop)
+            self.stop = self._strategy(stop)
 
         # wait behavior
-        wait_funcs = [lambda *args, **kwargs: 0]
+        wait_funcs = []
         if wait_fixed is not None:
             wait_funcs.append(self.fixed_sleep)  # type: ignore
 
@@ -143,25 +229,27 @@ class Retry:
         ):
             wait_funcs.append(self.incrementing_sleep)  # type: ignore
 
-        if wait_exponential_multiplier is not None or wait_exponential_max is not None:
+        if wait_exponential_jitter:
+            wait_funcs.append(self.exponential_jitter_sleep)  # type: ignore
+        elif (
+            wait_exponential_multiplier is not None or wait_exponential_max is not None
+        ):
             wait_funcs.append(self.exponential_sleep)  # type: ignore
 
         if wait_func is not None:
             self.wait = wait_func
         elif wait is None:
-            self.wait = lambda attempts, delay: max(
-                f(attempts, delay) for f in wait_funcs
-            )
+            self.wait = _max_wait(wait_funcs)
         else:
-            self.wait = getattr(self, wait)
+            self.wait = self._strategy(wait)
 
         # retry on exception filter
         if retry_on_exception is None:
             self._retry_on_exception = self.always_reject
         else:
-            # this allows for providing a tuple of exception types that should be allowed to retry
-            # on, and avoids having to create a callback that does the same thing
-            if isinstance(retry_on_exception, (tuple)):
+            # this allows for providing a tuple or set of exception types that should be allowed to
+            # retry on, and avoids having to create a callback that does the same thing
+            if isinstance(retry_on_exception, (tuple, set, frozenset)):
                 retry_on_exception = _retry_if_exception_of_type(retry_on_exception)
             self._retry_on_exception = retry_on_exception
 
@@ -173,6 +261,17 @@ class Retry:
 
         self._wrap_exception = wrap_exception
 
+        # a successful return can skip the Attempt bookkeeping when results are never retried
+        self._fast_path = self._retry_on_result is Retry.never_reject
+        self._reject = self._make_reject()
+
+    def _strategy(self, name):
+        """Bind a legacy stop/wait strategy method given by name."""
+        fn = getattr(type(self), name)
+        if not isinstance(fn, types.FunctionType):
+            raise ValueError(f"{name!r} is not a stop/wait strategy method")
+        return fn.__get__(self, type(self))
+
     def stop_after_attempt(self, previous_attempt_number, delay_since_first_attempt_ms):
         """Stop after the previous attempt >= stop_max_attempt_number."""
         return previous_attempt_number >= self._stop_max_attempt_number
@@ -182,10 +281,17 @@ class Retry:
         return delay_since_first_attempt_ms >= self._stop_max_delay
 
     def fixed_sleep(self, previous_attempt_number, delay_since_first_attempt_ms):
-        return self._wait_fixed
+        result = self._wait_fixed
+        return result if result > 0 else 0
 
-    def random_sleep(self, previous_attempt_number, delay_since_first_attempt_ms):
-        return random.randint(self._wait_random_min, self._wait_random_max)
+    def random_sleep(
+        self,
+        previous_attempt_number,
+        delay_since_first_attempt_ms,
+        _randrange=random.randrange,
+    ):
+        result = _randrange(self._wait_random_min, self._wait_random_upper)
+        return result if result > 0 else 0
 
     def incrementing_sleep(self, previous_attempt_number, delay_since_first_attempt_ms):
         result = self._wait_incrementing_start + (
@@ -195,10 +301,20 @@ class Retry:
         return result if result > 0 else 0
 
     def exponential_sleep(self, previous_attempt_number, delay_since_first_attempt_ms):
-        result = self._wait_exponential_multiplier * (2**previous_attempt_number)
+        result = self._wait_exponential_multiplier * (1 << previous_attempt_number)
         result = min(result, self._wait_exponential_max)
         return result if result > 0 else 0
 
+    def exponential_jitter_sleep(
+        self, previous_attempt_number, delay_since_first_attempt_ms
+    ):
+        """Full jitter: sleep a random time between 0 and the capped exponential backoff."""
+        result = min(
+            self._wait_exponential_max,
+            self._wait_exponential_multiplier * (1 << previous_attempt_number),
+        )
+        return random.random() * result if result > 0 else 0
+
     @staticmethod
     def never_reject(result):
         return False
@@ -209,58 +325,114 @@ class Retry:
 
     def should_reject(self, attempt):
         return (
-            self._retry_on_exception(attempt.value[1])
+            self._retry_on_exception(attempt._value)
             if attempt.has_exception
-            else self._retry_on_result(attempt.value)
+            else self._retry_on_result(attempt._value)
+        )
+
+    def _make_reject(self):
+        """Specialize should_reject for the configured predicates."""
+        on_exception = self._retry_on_exception
+        on_result = self._retry_on_result
+        if on_exception is Retry.always_reject:
+            if on_result is Retry.never_reject:
+                return lambda attempt: attempt.has_exception
+            return lambda attempt: attempt.has_exception or on_result(attempt._value)
+        if on_result is Retry.never_reject:
+            return lambda attempt: attempt.has_exception and on_exception(
+                attempt._value
+            )
+        return lambda attempt: (
+            on_exception(attempt._value)
+            if attempt.has_exception
+            else on_result(attempt._value)
         )
 
     def call(self, f, *args, **kwds):
-        start_time_ms = _current_time_ms()
+        # hot globals and the settings read on every attempt are hoisted into locals, keyword
+        # arguments are left to f
+        _sleep = time.sleep
+        _rand = random.random
+        _now = _monotonic_ns
+        before_attempts = self._before_attempts
+        after_attempts = self._after_attempts
+        fast_path = self._fast_path
+        reject = self._reject
+        stop = self.stop
+        wait = self.wait
+        wrap_exception = self._wrap_exception
+        wait_jitter_max = self._wait_jitter_max
+
+        start_ns = _now()
         attempt_number = 1
         while True:
-            if self._before_attempts:
-                self._before_attempts(attempt_number)
+            before_attempts(attempt_number)
 
             try:
-                attempt = Attempt(f(*args, **kwds), attempt_number, False)
-            except:
-                tb = sys.exc_info()
-                attempt = Attempt(tb, attempt_number, True)
+                result = f(*args, **kwds)
+            except BaseException as e:
+                attempt = Attempt(e, attempt_number, True)
+            else:
+                if fast_path:
+                    return result
+                attempt = Attempt(result, attempt_number, False)
 
-            if not self.should_reject(attempt):
-                return attempt.get(self._wrap_exception)
+            if not reject(attempt):
+                return attempt.get(wrap_exception)
 
-            if self._after_attempts:
-                self._after_attempts(attempt_number)
+            after_attempts(attempt_number)
 
-            delay_since_first_attempt_ms = _current_time_ms() - start_time_ms
-            if self.stop(attempt_number, delay_since_first_attempt_ms):
-                if not self._wrap_exception and attempt.has_exception:
+            delay_since_first_attempt_ms = (_now() - start_ns) // 1_000_000
+            if stop(attempt_number, delay_since_first_attempt_ms):
+                if not wrap_exception and attempt.has_exception:
                     # attempt.get() with an exception should cause raise, but raise just in case
                     raise attempt.get()  # type: ignore
                 else:
                     raise RetryError(attempt)
             else:
-                sleep_ms = self.wait(attempt_number, delay_since_first_attempt_ms)
-                if self._wait_jitter_max:
-                    jitter = random.random() * self._wait_jitter_max
+                sleep_ms = wait(attempt_number, delay_since_first_attempt_ms)
+                if wait_jitter_max:
+                    jitter = _rand() * wait_jitter_max
                     sleep_ms = sleep_ms + max(0, jitter)
-                time.sleep(sleep_ms / 1000.0)
+                if sleep_ms > 0:
+                    _sleep(sleep_ms * _MS_TO_S)
 
             attempt_number = attempt_number + 1
 
 
+_default_retry = Retry()
+
+
 class Attempt:
     """
     An Attempt encapsulates a call to a target function that may end as a normal return value from
     the function or an Exception depending on what occurred during the execution.
+
+    A failed Attempt keeps the exception instance and the traceback it was captured with, value
+    rebuilds the sys.exc_info() style (type, value, traceback) tuple on access.
     """
 
+    __slots__ = ("_value", "_traceback", "attempt_number", "has_exception")
+
     def __init__(self, value, attempt_number, has_exception):
-        self.value = value
+        if has_exception:
+            if isinstance(value, tuple):
+                value, self._traceback = value[1], value[2]
+            else:
+                self._traceback = value.__traceback__
+        else:
+            self._traceback = None
+        self._value = value
         self.attempt_number = attempt_number
         self.has_exception = has_exception
 
+    @property
+    def value(self):
+        if self.has_exception:
+            e = self._value
+            return (type(e), e, self._traceback)
+        return self._value
+
     def get(self, wrap_exception=False):
         """
         Return the return value of this Attempt instance or raise an Exception. If wrap_exception is
@@ -270,15 +442,19 @@ class Attempt:
             if wrap_exception:
                 raise RetryError(self)
             else:
-                _reraise(self.value[0], self.value[1], self.value[2])
+                # re-raising extends __traceback__, so restart from the captured one every time
+                raise self._value.with_traceback(self._traceback)
         else:
-            return self.value
+            return self._value
 
     def __repr__(self):
         if self.has_exception:
-            return f'Attempts: {self.attempt_number}, Error:\n{"".join(traceback.format_tb(self.value[2]))}'
+            # only needed for reporting, so keep it off the import path
+            import traceback
+
+            return f'Attempts: {self.attempt_number}, Error:\n{"".join(traceback.format_tb(self._traceback))}'
         else:
-            return f"Attempts: {self.attempt_number}, Value: {self.value}"
+            return f"Attempts: {self.attempt_number}, Value: {self._value}"
 
 
 class RetryError(Exception):
@@ -13,10 +13,13 @@
 ## See the License for the specific language governing permissions and
 ## limitations under the License.
 
+import sys
 import time
+import traceback
 import pytest
 import logging
 
+from retrrry import Attempt
 from retrrry import RetryError
 from retrrry import Retry
 from retrrry import retry
@@ -51,6 +54,25 @@ def test_legacy_explicit_stop_type():
     Retry(stop="stop_after_attempt")
 
 
+def test_legacy_explicit_stop_type_is_bound():
+    r = Retry(stop="stop_after_attempt", stop_max_attempt_number=3)
+    assert not r.stop(2, 6546)
+    assert r.stop(3, 6546)
+    with pytest.raises(AttributeError):
+        Retry(stop="stop_eventually")
+    with pytest.raises(ValueError):
+        Retry(stop="wait")
+    with pytest.raises(ValueError):
+        Retry(wait_fixed=10, wait="stop")
+
+
+def test_stop_after_attempt_or_delay():
+    r = Retry(stop_max_attempt_number=3, stop_max_delay=1000)
+    assert not r.stop(2, 999)
+    assert r.stop(3, 999)
+    assert r.stop(2, 1000)
+
+
 def test_stop_func():
     r = Retry(stop_func=lambda attempt, delay: attempt == delay)
     assert not r.stop(1, 3)
@@ -71,6 +93,14 @@ def test_fixed_sleep():
     assert 1000 == r.wait(12, 6546)
 
 
+def test_negative_sleep_is_clamped():
+    assert 0 == Retry(wait_fixed=-5).wait(1, 0)
+    assert 0 == Retry(wait_random_min=-20, wait_random_max=-10).wait(1, 0)
+    assert 0 == Retry(wait_fixed=-5, wait_random_min=-20, wait_random_max=-10).wait(
+        1, 0
+    )
+
+
 def test_incrementing_sleep():
     r = Retry(wait_incrementing_start=500, wait_incrementing_increment=100)
     assert 500 == r.wait(1, 6546)
@@ -78,6 +108,14 @@ def test_incrementing_sleep():
     assert 700 == r.wait(3, 6546)
 
 
+def test_combined_sleep():
+    r = Retry(
+        wait_fixed=1000, wait_incrementing_start=500, wait_incrementing_increment=400
+    )
+    assert 1000 == r.wait(1, 6546)
+    assert 1300 == r.wait(3, 6546)
+
+
 def test_random_sleep():
     r = Retry(wait_random_min=1000, wait_random_max=2000)
     times = set()
@@ -142,10 +180,59 @@ def test_exponential_with_max_wait_and_multiplier():
     assert r.wait(50, 0) == 50000
 
 
+def test_exponential_jitter():
+    r = Retry(
+        wait_exponential_jitter=True,
+        wait_exponential_max=50000,
+        wait_exponential_multiplier=1000,
+    )
+    times = set()
+    for _ in range(10):
+        t = r.wait(3, 0)
+        times.add(t)
+        assert 0 <= t <= 8000
+
+    # this is kind of non-deterministic...
+    assert len(times) > 1
+    for _ in range(10):
+        assert 0 <= r.wait(50, 0) <= 50000
+
+
+def test_positional_arguments_keep_their_order():
+    before, after = [], []
+    args = [None] * 18 + [before.append, after.append]
+    r = Retry(*args)
+    assert r.call(NoIOErrorAfterCount(1).go)
+    assert before == [1, 2]
+    assert after == [1]
+    assert r.wait(3, 0) == 0
+
+
 def test_legacy_explicit_wait_type():
     Retry(wait="exponential_sleep")
 
 
+def test_unselected_strategy_methods_use_defaults():
+    r = Retry(stop_max_attempt_number=3)
+    assert not r.stop_after_delay(1, 5)
+    assert r.stop_after_delay(1, 100)
+    assert r.fixed_sleep(1, 0) == 1000
+    assert 0 <= r.random_sleep(1, 0) <= 1000
+    assert r.incrementing_sleep(2, 0) == 100
+    assert r.exponential_sleep(3, 0) == 8
+    assert 0 <= r.exponential_jitter_sleep(3, 0) <= 8
+
+
+def test_legacy_explicit_types_use_defaults():
+    assert Retry(stop="stop_after_attempt").stop(5, 0)
+    assert Retry(stop="stop_after_delay").stop(1, 100)
+    assert Retry(wait="fixed_sleep").wait(1, 0) == 1000
+    assert 0 <= Retry(wait="random_sleep").wait(1, 0) <= 1000
+    assert Retry(wait="incrementing_sleep").wait(2, 0) == 100
+    assert Retry(wait="exponential_sleep").wait(3, 0) == 8
+    assert 0 <= Retry(wait="exponential_jitter_sleep").wait(3, 0) <= 8
+
+
 def test_wait_func():
     r = Retry(wait_func=lambda attempt, delay: attempt * delay)
     assert r.wait(1, 5) == 5
@@ -354,6 +441,42 @@ def _retryable_test_with_exception_type_custom_attempt_limit_wrap(thing):
     return thing.go()
 
 
+def test_retry_on_exception_types_are_validated():
+    with pytest.raises(TypeError):
+        Retry(retry_on_exception=(IOError, "NameError"))
+    with pytest.raises(TypeError):
+        Retry(retry_on_exception=(int,))
+    with pytest.raises(TypeError):
+        Retry(retry_on_exception=((IOError, "NameError"),))
+
+
+def test_retry_on_exception_nested_tuple():
+    r = Retry(retry_on_exception=((IOError, OSError), (CustomError,)))
+    assert r.call(NoIOErrorAfterCount(5).go)
+    assert r.call(NoCustomErrorAfterCount(5).go)
+    with pytest.raises(NameError):
+        r.call(NoNameErrorAfterCount(5).go)
+
+
+def test_retry_on_exception_set():
+    r = Retry(stop_max_attempt_number=10, retry_on_exception={IOError, CustomError})
+    assert r.call(NoIOErrorAfterCount(5).go)
+    assert r.call(NoCustomErrorAfterCount(5).go)
+    # subclasses still match through isinstance
+    assert Retry(retry_on_exception={Exception}).call(NoCustomErrorAfterCount(5).go)
+    with pytest.raises(NameError):
+        r.call(NoNameErrorAfterCount(5).go)
+
+
+def test_before_and_after_attempts():
+    before, after = [], []
+    r = Retry(before_attempts=before.append, after_attempts=after.append)
+    assert r.call(NoneReturnUntilAfterCount(2).go) is None
+    assert r.call(NoIOErrorAfterCount(2).go)
+    assert before == [1, 1, 2, 3]
+    assert after == [1, 2]
+
+
 # Test Decorator Wrapper
 
 
@@ -498,3 +621,111 @@ def test_defaults():
     assert _retryable_default_f(NoNameErrorAfterCount(5))
     assert _retryable_default(NoCustomErrorAfterCount(5))
     assert _retryable_default_f(NoCustomErrorAfterCount(5))
+
+
+def test_retry_object_reused_across_calls():
+    thing = NoneReturnUntilAfterCount(2)
+    assert _retryable_test_with_stop(thing)
+    # the shared Retry object must not carry attempt state from the previous call
+    assert _retryable_test_with_stop(NoneReturnUntilAfterCount(2))
+
+
+def test_slots():
+    r = Retry()
+    with pytest.raises(AttributeError):
+        r.unknown_attribute = 1
+    assert not hasattr(r, "__dict__")
+
+
+def test_reject_matches_should_reject():
+    try:
+        raise IOError("Hi there, I'm an IOError")
+    except IOError:
+        io_error = Attempt(sys.exc_info(), 1, True)
+    attempts = [io_error, Attempt(None, 1, False), Attempt(True, 1, False)]
+    for kwargs in [
+        {},
+        {"retry_on_exception": (NameError,)},
+        {"retry_on_result": retry_if_result_none},
+        {"retry_on_exception": (IOError,), "retry_on_result": retry_if_result_none},
+    ]:
+        r = Retry(**kwargs)
+        for attempt in attempts:
+            assert bool(r._reject(attempt)) == bool(r.should_reject(attempt))
+
+
+def test_reraise_keeps_original_traceback():
+    try:
+        _retryable_test_with_stop(NoIOErrorAfterCount(5))
+        pytest.xfail("Expected IOError")
+    except IOError as e:
+        tb = e.__traceback__
+        while tb.tb_next is not None:
+            tb = tb.tb_next
+        assert tb.tb_frame.f_code.co_name == "go"
+
+
+def test_call_forwards_all_keyword_arguments():
+    r = Retry(stop_max_attempt_number=2)
+    kwds = {"_sleep": 1, "_now": 2, "_rand": 3, "_ms_to_s": 4, "x": 5}
+    assert r.call(lambda **kw: kw, **kwds) == kwds
+
+
+def test_no_sleep_when_wait_is_zero(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(time, "sleep", sleeps.append)
+    assert _retryable_test_with_stop(NoneReturnUntilAfterCount(2))
+    assert sleeps == []
+    assert _retryable_test_with_wait(NoneReturnUntilAfterCount(2))
+    assert sleeps == [0.05, 0.05]
+
+
+def test_attempt_exception_info():
+    try:
+        raise IOError("Hi there, I'm an IOError")
+    except IOError as e:
+        error = e
+        exc_info = sys.exc_info()
+    assert Attempt(error, 1, True).value == exc_info
+    assert Attempt(exc_info, 1, True).value == exc_info
+    with pytest.raises(IOError):
+        Attempt(error, 1, True).get()
+
+
+def test_defaults_call_counts():
+    thing = NoNameErrorAfterCount(3)
+    assert _retryable_default(thing)
+    assert thing.counter == 3
+    assert _retryable_default(thing)
+    assert thing.counter == 3
+
+
+def test_defaults_retry_outside_exception_handler():
+    seen = []
+
+    @retry
+    def fail_once():
+        seen.append(sys.exc_info())
+        if len(seen) == 1:
+            raise ValueError("first failure")
+        try:
+            raise RuntimeError("second failure")
+        except RuntimeError as e:
+            return e
+
+    e = fail_once()
+    assert seen[1] == (None, None, None)
+    assert e.__context__ is None
+
+
+def test_attempt_traceback_is_stable():
+    try:
+        NoIOErrorAfterCount(1).go()
+    except IOError as e:
+        attempt = Attempt(e, 1, True)
+    tb = attempt.value[2]
+    for _ in range(2):
+        with pytest.raises(IOError):
+            attempt.get()
+    assert attempt.value[2] is tb
+    assert len(traceback.extract_tb(attempt.value[2])) == 2